@@ -1,6 +1,13 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+try:
+    # orjson serializes large summary payloads much faster than the stdlib json encoder
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    orjson = None
+    DefaultJSONResponse = JSONResponse
 from pydantic import BaseModel
 import uvicorn
 from typing import Optional, List
@@ -11,17 +18,25 @@ import json
 from threading import Lock
 from transcript_processor import TranscriptProcessor
 import time
+import os
+
+# Parse stored summary JSON with orjson when available. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so the existing handlers still apply.
+json_loads = orjson.loads if orjson is not None else json.loads
 
 # Load environment variables
 load_dotenv()
 
+# Log level is configurable via LOG_LEVEL (e.g. INFO or WARNING in production)
+LOG_LEVEL = getattr(logging, os.getenv('LOG_LEVEL', 'DEBUG').upper(), logging.DEBUG)
+
 # Configure logger with line numbers and function names
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(LOG_LEVEL)
 
 # Create console handler with formatting
 console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
+console_handler.setLevel(LOG_LEVEL)
 
 # Create formatter with line numbers and function names
 formatter = logging.Formatter(
@@ -37,7 +52,8 @@ if not logger.handlers:
 app = FastAPI(
     title="Meeting Summarizer API",
     description="API for processing and summarizing meeting transcripts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultJSONResponse
 )
 
 # Configure CORS
@@ -261,7 +277,7 @@ async def process_transcript_background(process_id: str, transcript: TranscriptR
         # Process each chunk's data
         for json_str in all_json_data:
             try:
-                json_dict = json.loads(json_str)
+                json_dict = json_loads(json_str)
                 if "MeetingName" in json_dict and json_dict["MeetingName"]:
                     final_summary["MeetingName"] = json_dict["MeetingName"]
                 for key in final_summary:
@@ -356,7 +372,7 @@ async def process_transcript_api(
             custom_prompt
         )
 
-        return JSONResponse({
+        return DefaultJSONResponse({
             "message": "Processing started",
             "process_id": process_id
         })
@@ -371,7 +387,7 @@ async def get_summary(meeting_id: str):
     try:
         result = await processor.db.get_transcript_data(meeting_id)
         if not result:
-            return JSONResponse(
+            return DefaultJSONResponse(
                 status_code=404,
                 content={
                     "status": "error",
@@ -385,26 +401,26 @@ async def get_summary(meeting_id: str):
             )
 
         status = result.get("status", "unknown").lower()
-        logger.debug(f"Summary status for meeting {meeting_id}: {status}, error: {result.get('error')}")
+        logger.debug("Summary status for meeting %s: %s, error: %s", meeting_id, status, result.get('error'))
 
         # Parse result data if available
         summary_data = None
         if result.get("result"):
             try:
-                parsed_result = json.loads(result["result"])
+                parsed_result = json_loads(result["result"])
                 if isinstance(parsed_result, str):
-                    summary_data = json.loads(parsed_result)
+                    summary_data = json_loads(parsed_result)
                 else:
                     summary_data = parsed_result
                 if not isinstance(summary_data, dict):
-                    logger.error(f"Parsed summary data is not a dictionary for meeting {meeting_id}")
+                    logger.error("Parsed summary data is not a dictionary for meeting %s", meeting_id)
                     summary_data = None
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON data for meeting {meeting_id}: {str(e)}")
+                logger.error("Failed to parse JSON data for meeting %s: %s", meeting_id, e)
                 status = "failed"
                 result["error"] = f"Invalid summary data format: {str(e)}"
             except Exception as e:
-                logger.error(f"Unexpected error parsing summary data for {meeting_id}: {str(e)}")
+                logger.error("Unexpected error parsing summary data for %s: %s", meeting_id, e)
                 status = "failed"
                 result["error"] = f"Error processing summary data: {str(e)}"
 
@@ -470,12 +486,12 @@ async def get_summary(meeting_id: str):
             response["error"] = result.get("error", "Unknown processing error")
             response["data"] = None
             response["meetingName"] = None
-            logger.info(f"Returning failed status with error: {response['error']}")
-            return JSONResponse(status_code=400, content=response)
+            logger.info("Returning failed status with error: %s", response['error'])
+            return DefaultJSONResponse(status_code=400, content=response)
 
         elif status in ["processing", "pending", "started"]:
             response["data"] = None
-            return JSONResponse(status_code=202, content=response)
+            return DefaultJSONResponse(status_code=202, content=response)
 
         elif status == "completed":
             if not summary_data:
@@ -483,19 +499,19 @@ async def get_summary(meeting_id: str):
                 response["error"] = "Completed but summary data is missing or invalid"
                 response["data"] = None
                 response["meetingName"] = None
-                return JSONResponse(status_code=500, content=response)
-            return JSONResponse(status_code=200, content=response)
+                return DefaultJSONResponse(status_code=500, content=response)
+            return DefaultJSONResponse(status_code=200, content=response)
 
         else:
             response["status"] = "error"
             response["error"] = f"Unknown or unexpected status: {status}"
             response["data"] = None
             response["meetingName"] = None
-            return JSONResponse(status_code=500, content=response)
+            return DefaultJSONResponse(status_code=500, content=response)
 
     except Exception as e:
-        logger.error(f"Error getting summary for {meeting_id}: {str(e)}", exc_info=True)
-        return JSONResponse(
+        logger.error("Error getting summary for %s: %s", meeting_id, e, exc_info=True)
+        return DefaultJSONResponse(
             status_code=500,
             content={
                 "status": "error",
@@ -512,13 +528,13 @@ async def get_summary(meeting_id: str):
 async def save_transcript(request: SaveTranscriptRequest):
     """Save transcript segments for a meeting without processing"""
     try:
-        logger.info(f"Received save-transcript request for meeting: {request.meeting_title}")
-        logger.info(f"Number of transcripts to save: {len(request.transcripts)}")
+        logger.info("Received save-transcript request for meeting: %s", request.meeting_title)
+        logger.info("Number of transcripts to save: %d", len(request.transcripts))
 
         # Log first transcript timestamps for debugging
-        if request.transcripts:
+        if request.transcripts and logger.isEnabledFor(logging.DEBUG):
             first = request.transcripts[0]
-            logger.debug(f"First transcript: audio_start_time={first.audio_start_time}, audio_end_time={first.audio_end_time}, duration={first.duration}")
+            logger.debug("First transcript: audio_start_time=%s, audio_end_time=%s, duration=%s", first.audio_start_time, first.audio_end_time, first.duration)
 
         # Generate a unique meeting ID
         meeting_id = f"meeting-{int(time.time() * 1000)}"
@@ -544,7 +560,7 @@ async def save_transcript(request: SaveTranscriptRequest):
         logger.info("Transcripts saved successfully")
         return {"status": "success", "message": "Transcript saved successfully", "meeting_id": meeting_id}
     except Exception as e:
-        logger.error(f"Error saving transcript: {str(e)}", exc_info=True)
+        logger.error("Error saving transcript: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/get-model-config")
@@ -625,7 +641,7 @@ async def search_transcripts(request: SearchRequest):
     """Search through meeting transcripts for the given query"""
     try:
         results = await db.search_transcripts(request.query)
-        return JSONResponse(content=results)
+        return DefaultJSONResponse(content=results)
     except Exception as e:
         logger.error(f"Error searching transcripts: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
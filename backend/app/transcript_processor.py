@@ -20,15 +20,15 @@ from ollama import AsyncClient
 
 
 
-# Set up logging
+load_dotenv()  # Load environment variables from .env file
+
+# Set up logging; LOG_LEVEL (e.g. INFO or WARNING) overrides the DEBUG default
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'DEBUG').upper(), logging.DEBUG),
     format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-load_dotenv()  # Load environment variables from .env file
-
 db = DatabaseManager()
 
 class Block(BaseModel):
@@ -83,7 +83,19 @@ class TranscriptProcessor:
         """Initialize the transcript processor."""
         logger.info("TranscriptProcessor initialized.")
         self.db = DatabaseManager()
-        self.active_clients = []  # Track active Ollama client sessions
+        self.active_clients = []  # Track open Ollama client sessions for cleanup
+        self.ollama_client = None  # Shared Ollama client, reused across chunks and requests
+        self.ollama_client_host = None
+
+    def get_ollama_client(self) -> AsyncClient:
+        """Return the shared Ollama client, creating it on first use or when OLLAMA_HOST changes."""
+        ollama_host = os.getenv('OLLAMA_HOST', 'http://127.0.0.1:11434')
+        if self.ollama_client is None or self.ollama_client_host != ollama_host:
+            self.ollama_client = AsyncClient(host=ollama_host)
+            self.ollama_client_host = ollama_host
+            self.active_clients.append(self.ollama_client)
+        return self.ollama_client
+
     async def process_transcript(self, text: str, model: str, model_name: str, chunk_size: int = 5000, overlap: int = 1000, custom_prompt: str = "") -> Tuple[int, List[str]]:
         """
         Process transcript text into chunks and generate structured summaries for each chunk using an AI model.
@@ -102,7 +114,7 @@ class TranscriptProcessor:
             - A list of JSON strings, where each string is the summary of a chunk.
         """
 
-        logger.info(f"Processing transcript (length {len(text)}) with model provider={model}, model_name={model_name}, chunk_size={chunk_size}, overlap={overlap}")
+        logger.info("Processing transcript (length %d) with model provider=%s, model_name=%s, chunk_size=%s, overlap=%s", len(text), model, model_name, chunk_size, overlap)
 
         all_json_data = []
         agent = None # Define agent variable
@@ -114,7 +126,7 @@ class TranscriptProcessor:
                 api_key = await db.get_api_key("claude")
                 if not api_key: raise ValueError("ANTHROPIC_API_KEY environment variable not set")
                 llm = AnthropicModel(model_name, provider=AnthropicProvider(api_key=api_key))
-                logger.info(f"Using Claude model: {model_name}")
+                logger.info("Using Claude model: %s", model_name)
             elif model == "ollama":
                 # Use environment variable for Ollama host configuration
                 ollama_host = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
@@ -129,21 +141,21 @@ class TranscriptProcessor:
                 else:
                     chunk_size = 30000
                     overlap = 1000
-                logger.info(f"Using Ollama model: {model_name}")
+                logger.info("Using Ollama model: %s", model_name)
             elif model == "groq":
                 api_key = await db.get_api_key("groq")
                 if not api_key: raise ValueError("GROQ_API_KEY environment variable not set")
                 llm = GroqModel(model_name, provider=GroqProvider(api_key=api_key))
-                logger.info(f"Using Groq model: {model_name}")
+                logger.info("Using Groq model: %s", model_name)
             # --- ADD OPENAI SUPPORT HERE ---
             elif model == "openai":
                 api_key = await db.get_api_key("openai")
                 if not api_key: raise ValueError("OPENAI_API_KEY environment variable not set")
                 llm = OpenAIModel(model_name, provider=OpenAIProvider(api_key=api_key))
-                logger.info(f"Using OpenAI model: {model_name}")
+                logger.info("Using OpenAI model: %s", model_name)
             # --- END OPENAI SUPPORT ---
             else:
-                logger.error(f"Unsupported model provider requested: {model}")
+                logger.error("Unsupported model provider requested: %s", model)
                 raise ValueError(f"Unsupported model provider: {model}")
 
             # Initialize the agent with the selected LLM
@@ -157,16 +169,16 @@ class TranscriptProcessor:
             # Split transcript into chunks
             step = chunk_size - overlap
             if step <= 0:
-                logger.warning(f"Overlap ({overlap}) >= chunk_size ({chunk_size}). Adjusting overlap.")
+                logger.warning("Overlap (%s) >= chunk_size (%s). Adjusting overlap.", overlap, chunk_size)
                 overlap = max(0, chunk_size - 100)
                 step = chunk_size - overlap
 
             chunks = [text[i:i+chunk_size] for i in range(0, len(text), step)]
             num_chunks = len(chunks)
-            logger.info(f"Split transcript into {num_chunks} chunks.")
+            logger.info("Split transcript into %d chunks.", num_chunks)
 
             for i, chunk in enumerate(chunks):
-                logger.info(f"Processing chunk {i+1}/{num_chunks}...")
+                logger.info("Processing chunk %d/%d...", i + 1, num_chunks)
                 try:
                     # Run the agent to get the structured summary for the chunk
                     if model != "ollama":
@@ -196,7 +208,7 @@ class TranscriptProcessor:
                         """,
                     )
                     else:
-                        logger.info(f"Using Ollama model: {model_name} and chunk size: {chunk_size} with overlap: {overlap}")
+                        logger.info("Using Ollama model: %s and chunk size: %s with overlap: %s", model_name, chunk_size, overlap)
                         response = await self.chat_ollama_model(model_name, chunk, custom_prompt)
                         
                         # Check if response is already a SummaryResponse object or a string that needs validation
@@ -206,30 +218,30 @@ class TranscriptProcessor:
                             # If it's a string (JSON), validate it
                             summary_result = SummaryResponse.model_validate_json(response)
                             
-                        logger.info(f"Summary result for chunk {i+1}: {summary_result}")
-                        logger.info(f"Summary result type for chunk {i+1}: {type(summary_result)}")
+                        logger.info("Summary result for chunk %d: %s", i + 1, summary_result)
+                        logger.info("Summary result type for chunk %d: %s", i + 1, type(summary_result))
 
                     if hasattr(summary_result, 'data') and isinstance(summary_result.data, SummaryResponse):
                          final_summary_pydantic = summary_result.data
                     elif isinstance(summary_result, SummaryResponse):
                          final_summary_pydantic = summary_result
                     else:
-                         logger.error(f"Unexpected result type from agent for chunk {i+1}: {type(summary_result)}")
+                         logger.error("Unexpected result type from agent for chunk %d: %s", i + 1, type(summary_result))
                          continue # Skip this chunk
 
                     # Convert the Pydantic model to a JSON string
                     chunk_summary_json = final_summary_pydantic.model_dump_json()
                     all_json_data.append(chunk_summary_json)
-                    logger.info(f"Successfully generated summary for chunk {i+1}.")
+                    logger.info("Successfully generated summary for chunk %d.", i + 1)
 
                 except Exception as chunk_error:
-                    logger.error(f"Error processing chunk {i+1}: {chunk_error}", exc_info=True)
+                    logger.error("Error processing chunk %d: %s", i + 1, chunk_error, exc_info=True)
 
-            logger.info(f"Finished processing all {num_chunks} chunks.")
+            logger.info("Finished processing all %d chunks.", num_chunks)
             return num_chunks, all_json_data
 
         except Exception as e:
-            logger.error(f"Error during transcript processing: {str(e)}", exc_info=True)
+            logger.error("Error during transcript processing: %s", e, exc_info=True)
             raise
     
     async def chat_ollama_model(self, model_name: str, transcript: str, custom_prompt: str):
@@ -254,11 +266,9 @@ class TranscriptProcessor:
         ''',
         }
 
-        # Create a client and track it for cleanup
-        ollama_host = os.getenv('OLLAMA_HOST', 'http://127.0.0.1:11434')
-        client = AsyncClient(host=ollama_host)
-        self.active_clients.append(client)
-        
+        # Reuse one client so every chunk shares the same HTTP connection pool
+        client = self.get_ollama_client()
+
         try:
             response = await client.chat(model=model_name, messages=[message], stream=True, format=SummaryResponse.model_json_schema())
             
@@ -281,10 +291,6 @@ class TranscriptProcessor:
         except Exception as e:
             logger.error(f"Error in Ollama chat: {e}")
             raise
-        finally:
-            # Remove the client from active clients list
-            if client in self.active_clients:
-                self.active_clients.remove(client)
 
     def cleanup(self):
         """Clean up resources used by the TranscriptProcessor."""
@@ -301,12 +307,14 @@ class TranscriptProcessor:
                 for client in self.active_clients:
                     try:
                         # Close the client's underlying connection
-                        if hasattr(client, '_client') and hasattr(client._client, 'close'):
+                        if hasattr(client, '_client') and hasattr(client._client, 'aclose'):
                             asyncio.create_task(client._client.aclose())
                     except Exception as client_error:
                         logger.error(f"Error closing Ollama client: {client_error}", exc_info=True)
                 # Clear the list
                 self.active_clients.clear()
+                self.ollama_client = None
+                self.ollama_client_host = None
                 logger.info("All Ollama client sessions terminated")
         except Exception as e:
             logger.error(f"Error during TranscriptProcessor cleanup: {str(e)}", exc_info=True)